@@ -41,6 +41,12 @@ class Settings(BaseSettings):
     # Search
     TOP_K_RETRIEVAL: int = 20
     TOP_K_RERANK: int = 5
+    BM25_COMPACTION_RATIO: float = 0.2  # compact once this share of the corpus is tombstoned
+
+    # Document catalog
+    DOCUMENTS_PAGE_SIZE: int = 50
+    DOCUMENTS_MAX_PAGE_SIZE: int = 500
+    NEO4J_DELETE_BATCH_SIZE: int = 1000
 
     class Config:
         env_file = ".env"
@@ -11,6 +11,8 @@ from app.services.memory import MemoryService
 from app.services.generation import GenerationService, LLMProvider
 from app.services.graph import GraphService
 from app.services.ingestion import IngestionService
+from app.services.catalog import CatalogService
+from app.models.document import Document, DeletionReport
 
 app = FastAPI(title=settings.PROJECT_NAME)
 
@@ -29,29 +31,81 @@ search_service = SearchService(
     settings.QDRANT_HOST,
     settings.QDRANT_PORT,
     settings.QDRANT_COLLECTION,
-    embedding_service
+    embedding_service,
+    bm25_compaction_ratio=settings.BM25_COMPACTION_RATIO
 )
 reranker_service = RerankerService()
 memory_service = MemoryService(settings.REDIS_HOST, settings.REDIS_PORT)
 generation_service = GenerationService(settings.OPENAI_API_KEY, settings.ANTHROPIC_API_KEY)
 graph_service = GraphService(settings.NEO4J_URI, settings.NEO4J_USER, settings.NEO4J_PASSWORD)
 ingestion_service = IngestionService()
+catalog_service = CatalogService(settings.REDIS_HOST, settings.REDIS_PORT)
+
+
+def delete_document_everywhere(document: Document) -> DeletionReport:
+    """Cascade a document delete to Qdrant, BM25 and Neo4j, then drop it from the catalog"""
+    vector_points, lexical_chunks = search_service.delete_document(document.user_id, document.id, document.chunks)
+    graph_nodes, graph_relationships = graph_service.delete_documents(
+        [document.id], document.user_id, batch_size=settings.NEO4J_DELETE_BATCH_SIZE
+    )
+    catalog_service.remove_document(document)
+
+    # Upload-time estimates are per document; scale them by what each store actually removed
+    num_chunks = len(document.chunks) or 1
+    vector_bytes = document.storage.get('vector', 0) * vector_points // num_chunks
+    graph_bytes = graph_service.estimate_record_bytes(graph_nodes, graph_relationships)
+    bytes_reclaimed = {
+        'vector': vector_bytes,
+        'graph': graph_bytes,
+        # Tombstoned BM25 entries stay in memory until the corpus is next compacted
+        'lexical_pending': document.storage.get('lexical', 0) * lexical_chunks // num_chunks,
+        'total': vector_bytes + graph_bytes,
+    }
+    return DeletionReport(
+        document_id=document.id,
+        vector_points_deleted=vector_points,
+        lexical_chunks_tombstoned=lexical_chunks,
+        graph_nodes_deleted=graph_nodes,
+        graph_relationships_deleted=graph_relationships,
+        bytes_reclaimed=bytes_reclaimed
+    )
 
 
 @app.post("/api/v1/documents/upload")
 async def upload_document(file: UploadFile = File(...), user_id: str = "default_user"):
-    """Upload and process document"""
+    """Upload and process document, replacing any earlier upload with the same filename"""
     try:
+        previous = catalog_service.get_document_by_filename(user_id, file.filename)
+
         document, chunks = await ingestion_service.process_file(file.file, file.filename, user_id)
 
-        await search_service.index_chunks(chunks, document.chunks, user_id, document.id, document.metadata)
+        document.storage = await search_service.index_chunks(chunks, document.chunks, user_id, document.id, document.metadata)
 
         graph_service.create_document_node(document)
 
-        return {"document_id": document.id, "filename": document.filename, "num_chunks": len(chunks), "status": "success"}
+        catalog_service.add_document(document)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    # Only drop the old version once the new one is fully indexed. A failure here leaves the
+    # old version in the catalog, so it can still be removed via DELETE /api/v1/documents/{id}.
+    replaced, replace_error = None, None
+    if previous:
+        try:
+            replaced = delete_document_everywhere(previous)
+        except Exception as e:
+            replace_error = str(e)
+
+    return {
+        "document_id": document.id,
+        "filename": document.filename,
+        "num_chunks": len(chunks),
+        "replaced_document_id": previous.id if previous else None,
+        "replaced": replaced,
+        "replace_error": replace_error,
+        "status": "success"
+    }
+
 
 @app.post("/api/v1/chat")
 async def chat(query: str, session_id: Optional[str] = None, user_id: str = "default_user", top_k_retrieval: int = 20, top_k_rerank: int = 5, provider: LLMProvider = LLMProvider.ANTHROPIC):
@@ -83,9 +137,31 @@ async def chat(query: str, session_id: Optional[str] = None, user_id: str = "def
 
 
 @app.get("/api/v1/documents")
-async def list_documents(user_id: str = "default_user"):
-    # TODO: implement document listing
-    return {"documents": []}
+async def list_documents(user_id: str = "default_user", limit: int = settings.DOCUMENTS_PAGE_SIZE, cursor: Optional[str] = None):
+    """List documents newest first; pass back next_cursor to fetch the following page"""
+    limit = max(1, min(limit, settings.DOCUMENTS_MAX_PAGE_SIZE))
+    try:
+        documents, next_cursor = catalog_service.list_documents(user_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "documents": [document.model_dump(mode="json", exclude={"chunks"}) for document in documents],
+        "next_cursor": next_cursor
+    }
+
+
+@app.delete("/api/v1/documents/{document_id}")
+async def delete_document(document_id: str, user_id: str = "default_user"):
+    """Delete a document from every store and report the storage reclaimed"""
+    document = catalog_service.get_document(user_id, document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail=f"Document not found: {document_id}")
+
+    try:
+        return delete_document_everywhere(document)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/health")
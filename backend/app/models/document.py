@@ -29,6 +29,7 @@ class Document(BaseModel):
     size: int
     chunks: List[str] = []
     metadata: Dict = {}
+    storage: Dict[str, int] = {}
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -38,3 +39,12 @@ class SearchResult(BaseModel):
     score: float
     metadata: Dict
     document_id: str
+
+
+class DeletionReport(BaseModel):
+    document_id: str
+    vector_points_deleted: int = 0
+    lexical_chunks_tombstoned: int = 0
+    graph_nodes_deleted: int = 0
+    graph_relationships_deleted: int = 0
+    bytes_reclaimed: Dict[str, int] = {}
@@ -0,0 +1,106 @@
+import redis
+import base64
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from app.models.document import Document
+
+
+class CatalogService:
+    """Per-user document catalog stored in Redis.
+
+    Each user has a sorted set of document ids scored by ``created_at``, which
+    serves as the ``(user_id, created_at)`` index for newest-first listing.
+    Ties on the timestamp are broken by document id so cursors stay stable.
+    """
+
+    def __init__(self, redis_host: str, redis_port: int):
+        self.redis = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+
+    def add_document(self, document: Document):
+        pipe = self.redis.pipeline()
+        pipe.set(self._document_key(document.user_id, document.id), document.model_dump_json())
+        pipe.zadd(self._index_key(document.user_id), {document.id: self._score(document.created_at)})
+        pipe.hset(self._filename_key(document.user_id), document.filename, document.id)
+        pipe.execute()
+
+    def get_document(self, user_id: str, document_id: str) -> Optional[Document]:
+        data = self.redis.get(self._document_key(user_id, document_id))
+        return Document.model_validate_json(data) if data else None
+
+    def get_document_by_filename(self, user_id: str, filename: str) -> Optional[Document]:
+        document_id = self.redis.hget(self._filename_key(user_id), filename)
+        return self.get_document(user_id, document_id) if document_id else None
+
+    def remove_document(self, document: Document):
+        filename_key = self._filename_key(document.user_id)
+        pipe = self.redis.pipeline()
+        pipe.delete(self._document_key(document.user_id, document.id))
+        pipe.zrem(self._index_key(document.user_id), document.id)
+        pipe.execute()
+        # A re-upload may already point the filename at its replacement
+        if self.redis.hget(filename_key, document.filename) == document.id:
+            self.redis.hdel(filename_key, document.filename)
+
+    def list_documents(self, user_id: str, limit: int, cursor: Optional[str] = None) -> Tuple[List[Document], Optional[str]]:
+        """Return one newest-first page of documents and the cursor for the next page"""
+        key = self._index_key(user_id)
+        # Fetch one extra id to know whether another page exists
+        wanted = limit + 1
+
+        if cursor:
+            score, last_id = self._decode_cursor(cursor)
+            # Same-timestamp entries come back in descending id order
+            document_ids = [m for m in self.redis.zrevrangebyscore(key, score, score) if m < last_id][:wanted]
+            if len(document_ids) < wanted:
+                document_ids += self.redis.zrevrangebyscore(
+                    key, f"({score!r}", "-inf", start=0, num=wanted - len(document_ids)
+                )
+        else:
+            document_ids = self.redis.zrevrange(key, 0, wanted - 1)
+
+        has_more = len(document_ids) > limit
+        document_ids = document_ids[:limit]
+        if not document_ids:
+            return [], None
+
+        records = self.redis.mget([self._document_key(user_id, doc_id) for doc_id in document_ids])
+        documents = [Document.model_validate_json(r) for r in records if r]
+
+        next_cursor = None
+        if has_more:
+            next_cursor = self._encode_cursor(self._score_for(key, document_ids[-1]), document_ids[-1])
+        return documents, next_cursor
+
+    def _score_for(self, key: str, document_id: str) -> float:
+        return float(self.redis.zscore(key, document_id))
+
+    @staticmethod
+    def _score(created_at: datetime) -> float:
+        # created_at defaults to naive UTC
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at.timestamp()
+
+    @staticmethod
+    def _encode_cursor(score: float, document_id: str) -> str:
+        return base64.urlsafe_b64encode(f"{score!r}:{document_id}".encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[float, str]:
+        try:
+            score, document_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(':', 1)
+            return float(score), document_id
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    @staticmethod
+    def _index_key(user_id: str) -> str:
+        return f"documents:{user_id}"
+
+    @staticmethod
+    def _document_key(user_id: str, document_id: str) -> str:
+        return f"document:{user_id}:{document_id}"
+
+    @staticmethod
+    def _filename_key(user_id: str) -> str:
+        return f"document_filenames:{user_id}"
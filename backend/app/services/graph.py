@@ -1,9 +1,13 @@
 from neo4j import GraphDatabase
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from app.models.document import Document
 
 
 class GraphService:
+    # Neo4j record-format sizes; property and string stores are not counted
+    NODE_RECORD_BYTES = 15
+    RELATIONSHIP_RECORD_BYTES = 34
+
     def __init__(self, uri: str, user: str, password: str):
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
 
@@ -44,6 +48,80 @@ class GraphService:
                         entity_type=entity['type']
                     )
 
+    def delete_documents(self, document_ids: List[str], user_id: str, batch_size: int = 1000) -> Tuple[int, int]:
+        """Delete documents and any entities they leave orphaned.
+
+        CONTAINS_ENTITY edges (one per chunk per entity) are removed in batches
+        before the nodes, so large documents never delete in a single transaction.
+        Returns (nodes deleted, relationships deleted).
+        """
+        nodes_deleted = 0
+        relationships_deleted = 0
+        # CALL ... IN TRANSACTIONS needs an auto-commit transaction, which session.run provides
+        with self.driver.session() as session:
+            entity_ids = [
+                record['entity_id'] for record in session.run(
+                    """
+                    MATCH (d:Document {user_id: $user_id})-[:CONTAINS_ENTITY]->(e:Entity)
+                    WHERE d.id IN $document_ids
+                    RETURN DISTINCT elementId(e) AS entity_id
+                    """,
+                    document_ids=document_ids,
+                    user_id=user_id
+                )
+            ]
+
+            counters = session.run(
+                f"""
+                MATCH (d:Document {{user_id: $user_id}})-[r:CONTAINS_ENTITY]->()
+                WHERE d.id IN $document_ids
+                CALL {{
+                    WITH r
+                    DELETE r
+                }} IN TRANSACTIONS OF {int(batch_size)} ROWS
+                """,
+                document_ids=document_ids,
+                user_id=user_id
+            ).consume().counters
+            relationships_deleted += counters.relationships_deleted
+
+            counters = session.run(
+                f"""
+                MATCH (d:Document {{user_id: $user_id}})
+                WHERE d.id IN $document_ids
+                CALL {{
+                    WITH d
+                    DETACH DELETE d
+                }} IN TRANSACTIONS OF {int(batch_size)} ROWS
+                """,
+                document_ids=document_ids,
+                user_id=user_id
+            ).consume().counters
+            nodes_deleted += counters.nodes_deleted
+            relationships_deleted += counters.relationships_deleted
+
+            if entity_ids:
+                counters = session.run(
+                    f"""
+                    UNWIND $entity_ids AS entity_id
+                    MATCH (e:Entity)
+                    WHERE elementId(e) = entity_id AND NOT (e)<-[:CONTAINS_ENTITY]-()
+                    CALL {{
+                        WITH e
+                        DETACH DELETE e
+                    }} IN TRANSACTIONS OF {int(batch_size)} ROWS
+                    """,
+                    entity_ids=entity_ids
+                ).consume().counters
+                nodes_deleted += counters.nodes_deleted
+                relationships_deleted += counters.relationships_deleted
+
+        return nodes_deleted, relationships_deleted
+
+    def estimate_record_bytes(self, nodes: int, relationships: int) -> int:
+        """Estimate store bytes held by node and relationship records"""
+        return nodes * self.NODE_RECORD_BYTES + relationships * self.RELATIONSHIP_RECORD_BYTES
+
     def query_related_documents(self, entity_name: str, user_id: str) -> List[str]:
         with self.driver.session() as session:
             result = session.run(
@@ -1,7 +1,17 @@
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    Distance,
+    VectorParams,
+    PointStruct,
+    PayloadSchemaType,
+    Filter,
+    FieldCondition,
+    MatchValue,
+    FilterSelector,
+)
 from rank_bm25 import BM25Okapi
-from typing import List, Dict
+from typing import List, Dict, Tuple
+import json
 import numpy as np
 from app.models.document import SearchResult
 
@@ -13,6 +23,7 @@ class SearchService:
         qdrant_port: int,
         collection_name: str,
         embedding_service,
+        bm25_compaction_ratio: float = 0.2,
     ):
         self.qdrant = QdrantClient(host=qdrant_host, port=qdrant_port)
         self.collection_name = collection_name
@@ -30,12 +41,25 @@ class SearchService:
                 )
             )
 
+        # Keyword indexes keep per-user and per-document filters (searches, deletes) cheap
+        for field_name in ('user_id', 'document_id'):
+            self.qdrant.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType.KEYWORD
+            )
+
         # BM25 index (in-memory for simplicity)
         self.bm25_corpus = []
         self.bm25_index = None
-
-    async def index_chunks(self, chunks: List[str], chunk_ids: List[str], user_id: str, document_id: str, metadata: Dict):
-        """Index document chunks in vector DB and BM25"""
+        # Deleted chunk ids, dropped from the corpus on the next rebuild
+        self.bm25_tombstones = set()
+        # Chunk ids that are indexed and not tombstoned
+        self.bm25_live_ids = set()
+        self.bm25_compaction_ratio = bm25_compaction_ratio
+
+    async def index_chunks(self, chunks: List[str], chunk_ids: List[str], user_id: str, document_id: str, metadata: Dict) -> Dict[str, int]:
+        """Index document chunks in vector DB and BM25, returning estimated bytes stored per store"""
         embeddings = self.embedding_service.embed_texts(chunks)
 
         points = [
@@ -58,13 +82,56 @@ class SearchService:
         )
 
         tokenized_chunks = [chunk.lower().split() for chunk in chunks]
-        self.bm25_corpus.extend(list(zip(chunk_ids, tokenized_chunks, chunks)))
+        entries = list(zip(chunk_ids, tokenized_chunks, chunks))
+        self.bm25_corpus.extend(entries)
+        self.bm25_live_ids.update(chunk_ids)
         self._rebuild_bm25()
 
+        return {
+            # float32 vectors plus JSON-encoded payloads
+            'vector': sum(len(embedding) * 4 + len(json.dumps(p.payload).encode('utf-8')) for embedding, p in zip(embeddings, points)),
+            'lexical': sum(self._bm25_entry_size(entry) for entry in entries),
+        }
+
+    def delete_document(self, user_id: str, document_id: str, chunk_ids: List[str]) -> Tuple[int, int]:
+        """Delete a document's chunks, returning (vector points deleted, BM25 chunks tombstoned)"""
+        document_filter = Filter(
+            must=[
+                FieldCondition(key='user_id', match=MatchValue(value=user_id)),
+                FieldCondition(key='document_id', match=MatchValue(value=document_id)),
+            ]
+        )
+        num_points = self.qdrant.count(
+            collection_name=self.collection_name,
+            count_filter=document_filter,
+            exact=True
+        ).count
+        if num_points:
+            self.qdrant.delete(
+                collection_name=self.collection_name,
+                points_selector=FilterSelector(filter=document_filter)
+            )
+
+        # Tombstone instead of rebuilding BM25 on every delete
+        tombstoned = self.bm25_live_ids.intersection(chunk_ids)
+        self.bm25_live_ids.difference_update(tombstoned)
+        self.bm25_tombstones.update(tombstoned)
+        if len(self.bm25_tombstones) >= self.bm25_compaction_ratio * len(self.bm25_corpus):
+            self._rebuild_bm25()
+
+        return num_points, len(tombstoned)
+
     def _rebuild_bm25(self):
-        """Rebuild BM25 index"""
-        if self.bm25_corpus:
-            self.bm25_index = BM25Okapi([c[1] for c in self.bm25_corpus])
+        """Rebuild BM25 index, compacting away tombstoned chunks"""
+        if self.bm25_tombstones:
+            self.bm25_corpus = [c for c in self.bm25_corpus if c[0] not in self.bm25_tombstones]
+            self.bm25_tombstones.clear()
+        self.bm25_index = BM25Okapi([c[1] for c in self.bm25_corpus]) if self.bm25_corpus else None
+
+    @staticmethod
+    def _bm25_entry_size(entry: Tuple[str, List[str], str]) -> int:
+        chunk_id, tokens, content = entry
+        return len(chunk_id) + sum(len(t.encode('utf-8')) for t in tokens) + len(content.encode('utf-8'))
 
     async def hybrid_search(self, query: str, user_id: str, top_k: int = 20, alpha: float = 0.5) -> List[SearchResult]:
         """Perform hybrid search combining vector and BM25"""
@@ -85,6 +152,8 @@ class SearchService:
 
             # naive top-k selection across corpus
             for i, (chunk_id, _, content) in enumerate(self.bm25_corpus):
+                if chunk_id in self.bm25_tombstones:
+                    continue
                 bm25_results.append({'chunk_id': chunk_id, 'content': content, 'score': bm25_scores[i]})
 
         combined = {}